@@ -1,6 +1,6 @@
 """A video class."""
 
-from typing import Sequence, Optional
+from typing import FrozenSet, Sequence, Optional
 
 
 class Video:
@@ -16,6 +16,10 @@ class Video:
         # in case the caller changes the 'video_tags' they passed to us
         self._tags = tuple(video_tags)
 
+        # Lowercased copies used by the case-insensitive searches
+        self._title_lower = video_title.lower()
+        self._tags_lower = frozenset(tag.lower() for tag in self._tags)
+
     @property
     def title(self) -> str:
         """Returns the title of a video."""
@@ -31,6 +35,16 @@ class Video:
         """Returns the list of tags of a video."""
         return self._tags
 
+    @property
+    def title_lower(self) -> str:
+        """Returns the lowercased title of a video."""
+        return self._title_lower
+
+    @property
+    def tags_lower(self) -> FrozenSet[str]:
+        """Returns the set of lowercased tags of a video."""
+        return self._tags_lower
+
     @property
     def flag(self) -> Optional[str]:
         """Returns the the flag status of a video."""
@@ -1,5 +1,6 @@
 """A video library class."""
 import random
+from bisect import bisect_right
 
 from .video import Video
 from pathlib import Path
@@ -12,6 +13,11 @@ def _csv_reader_with_strip(reader):
     yield from ((item.strip() for item in line) for line in reader)
 
 
+# Separator between titles in the title search buffer. Titles are read
+# line by line, so they can never contain it.
+_TITLE_SEP = "\n"
+
+
 class VideoLibraryError(Exception):
     pass
 
@@ -19,10 +25,17 @@ class VideoLibraryError(Exception):
 class VideoLibrary:
     """A class used to represent a Video Library."""
 
-    def __init__(self):
-        """The VideoLibrary class is initialized."""
+    def __init__(self, videos_file=None):
+        """The VideoLibrary class is initialized.
+
+        Args:
+            videos_file: Path of the file to load videos from. Defaults to the
+                bundled videos.txt.
+        """
+        if videos_file is None:
+            videos_file = Path(__file__).parent / "videos.txt"
         self._videos = {}
-        with open(Path(__file__).parent / "videos.txt") as video_file:
+        with open(videos_file) as video_file:
             reader = _csv_reader_with_strip(
                 csv.reader(video_file, delimiter="|"))
             for video_info in reader:
@@ -32,15 +45,65 @@ class VideoLibrary:
                     url,
                     [tag.strip() for tag in tags.split(",")] if tags else [],
                 )
+        # The library never changes after loading, so both orders only need
+        # to be computed once. Sorting by title is stable, so videos with
+        # equal titles keep their string order.
+        self._all_videos = tuple(sorted(self._videos.values(), key=str))
+        self._videos_by_title = tuple(
+            sorted(self._all_videos, key=lambda v: v.title))
+        # Unflagged videos in title order, kept up to date by the flag hooks
+        self._unflagged = self._videos_by_title
+        # All lowercased titles in title order, joined into one string so a
+        # substring search is a single str.find scan instead of a Python loop.
+        self._titles_buf = _TITLE_SEP.join(v.title_lower for v in self._videos_by_title)
+        self._title_starts = []
+        start = 0
+        for v in self._videos_by_title:
+            self._title_starts.append(start)
+            start += len(v.title_lower) + len(_TITLE_SEP)
+
+    @property
+    def videos_by_id(self):
+        """Returns the mapping of video id to Video. Must not be modified."""
+        return self._videos
 
     def get_all_videos(self):
         """Returns all available video information from the video library."""
-        return list(sorted(self._videos.values(), key=str))
+        return self._all_videos
 
     def get_unflagged_videos(self):
-        """Returns all unflagged videos from the video library."""
-        unflagged = [v for v in self._videos.values() if not v.flag]
-        return list(sorted(unflagged, key=str))
+        """Returns all unflagged videos from the video library, ordered by title."""
+        return self._unflagged
+
+    def flag_video_hook(self, video):
+        """Must be called after a video has been flagged."""
+        self._unflagged = tuple(v for v in self._unflagged if v is not video)
+
+    def unflag_video_hook(self):
+        """Must be called after a flag has been removed from a video."""
+        self._unflagged = tuple(v for v in self._videos_by_title if not v.flag)
+
+    def search_titles(self, needle):
+        """Yields unflagged videos whose title contains the needle, ordered by title.
+
+        Args:
+            needle: The lowercased search term.
+        """
+        if _TITLE_SEP in needle:
+            return
+        if not needle:
+            yield from self.get_unflagged_videos()
+            return
+        pos = self._titles_buf.find(needle)
+        while pos != -1:
+            i = bisect_right(self._title_starts, pos) - 1
+            video = self._videos_by_title[i]
+            if not video.flag:
+                yield video
+            if i + 1 == len(self._title_starts):
+                return
+            # continue from the next title, one match per video is enough
+            pos = self._titles_buf.find(needle, self._title_starts[i + 1])
 
     def __getitem__(self, video_id):
         try:
@@ -62,6 +125,6 @@ class VideoLibrary:
 
     def get_random_video_id(self):
         try:
-            return random.choice([video.video_id for video in self.get_unflagged_videos()])
+            return random.choice([video.video_id for video in self._all_videos if not video.flag])
         except IndexError:
             return None
@@ -41,6 +41,9 @@ class VideoPlayback:
         self._check_video()
         return self._video
 
+    def snapshot(self):
+        return self._video, self._state
+
     @property
     def state(self):
         return self._state
@@ -1,39 +1,51 @@
 """A video player class."""
 import random
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, Optional, Tuple
 
-from .video_library import VideoLibrary, VideoLibraryError
+from .video import Video
+from .video_library import VideoLibrary
 from .video_playback import VideoPlayback, PlaybackState, VideoPlaybackError
-from .video_playlist import PlaylistError, Playlist
+from .video_playlist import PlaylistError, Playlist, normalize_name
 
 
 class VideoPlayer:
     """A class used to represent a Video Player."""
 
-    def __init__(self):
+    def __init__(self, reader: Optional[Callable[[], str]] = None) -> None:
+        """VideoPlayer constructor.
+
+        Args:
+            reader: Called to read the answer to search prompts. Defaults to input.
+        """
+        self._reader = reader if reader is not None else input
         self._video_library = VideoLibrary()
+        # looked up on every command, so keep a direct reference to the dict
+        self._videos = self._video_library.videos_by_id
         self._playback = VideoPlayback()
-        self._playlists = {}
+        self._playlists: Dict[str, Playlist] = {}
+        # Per-instance search caches, cleared whenever a flag changes
+        self._title_search = lru_cache(maxsize=128)(self._do_title_search)
+        self._tag_search = lru_cache(maxsize=128)(self._do_tag_search)
 
-    def number_of_videos(self):
+    def number_of_videos(self) -> None:
         num_videos = len(self._video_library.get_all_videos())
         print(f"{num_videos} videos in the library")
 
-    def show_all_videos(self):
+    def show_all_videos(self) -> None:
         """Returns all videos."""
-        print("Here's a list of all available videos:")
-        for v in self._video_library.get_all_videos():
-            print(v)
+        print("\n".join(["Here's a list of all available videos:",
+                         *map(str, self._video_library.get_all_videos())]))
 
-    def play_video(self, video_id):
+    def play_video(self, video_id: str) -> None:
         """Plays the respective video.
 
         Args:
             video_id: The video_id to be played.
         """
-        try:
-            video = self._video_library[video_id]
-        except VideoLibraryError as e:
-            print(f"Cannot play video: {e}")
+        video = self._videos.get(video_id)
+        if video is None:
+            print("Cannot play video: Video does not exist")
             return
         if self._playback.state != PlaybackState.STOPPED:
             self.stop_video()
@@ -43,7 +55,7 @@ class VideoPlayer:
         self._playback.play(video)
         print(f"Playing video: {video.title}")
 
-    def stop_video(self):
+    def stop_video(self) -> None:
         """Stops the current video."""
         try:
             video = self._playback.get_video()
@@ -52,7 +64,7 @@ class VideoPlayer:
         except VideoPlaybackError as e:
             print(f"Cannot stop video: {e}")
 
-    def play_random_video(self):
+    def play_random_video(self) -> None:
         """Plays a random video from the video library."""
         video = self._video_library.get_random_video_id()
         if video is None:
@@ -60,51 +72,47 @@ class VideoPlayer:
         else:
             self.play_video(video)
 
-    def pause_video(self):
+    def pause_video(self) -> None:
         """Pauses the current video."""
-        try:
-            video = self._playback.get_video()
-        except VideoPlaybackError as e:
-            print(f"Cannot pause video: {e}")
+        video, state = self._playback.snapshot()
+        if video is None:
+            print("Cannot pause video: No video is currently playing")
             return
 
-        if self._playback.state == PlaybackState.PAUSED:
+        if state == PlaybackState.PAUSED:
             print(f"Video already paused: {video.title}")
         else:
             print(f"Pausing video: {video.title}")
             self._playback.pause()
         return
 
-    def continue_video(self):
+    def continue_video(self) -> None:
         """Resumes playing the current video."""
 
-        try:
-            video = self._playback.get_video()
-        except VideoPlaybackError as e:
-            print(f"Cannot continue video: {e}")
+        video, state = self._playback.snapshot()
+        if video is None:
+            print("Cannot continue video: No video is currently playing")
             return
-        if self._playback.state != PlaybackState.PAUSED:
+        if state != PlaybackState.PAUSED:
             print("Cannot continue video: Video is not paused")
         else:
             print(f"Continuing video: {video.title}")
             self._playback.play(video)
         return
 
-    def show_playing(self):
+    def show_playing(self) -> None:
         """Displays video currently playing."""
 
-        try:
-            video = self._playback.get_video()
-        except VideoPlaybackError as e:
-            print(f"Cannot get information on currently playing video: {e}")
+        video, state = self._playback.snapshot()
+        if video is None:
+            print("Cannot get information on currently playing video: No video is currently playing")
             return
-        state = self._playback.state
         if state == PlaybackState.STOPPED:
             print("No video is currently playing")
         else:
             print(f"Currently playing: {video}" + (" - PAUSED" if state == PlaybackState.PAUSED else ""))
 
-    def create_playlist(self, playlist_name):
+    def create_playlist(self, playlist_name: str) -> None:
         """Creates a playlist with a given name.
 
         Args:
@@ -112,29 +120,26 @@ class VideoPlayer:
         """
         # removing whitespace
         playlist_name = ''.join(playlist_name.split())
+        key = normalize_name(playlist_name)
 
-        if playlist_name.lower() in self._playlists:
+        if key in self._playlists:
             print("Cannot create playlist: A playlist with the same name already exists")
             return
 
-        self._playlists[playlist_name.lower()] = Playlist(playlist_name)
+        self._playlists[key] = Playlist(playlist_name)
         print(f"Successfully created new playlist: {playlist_name}")
 
-    def add_to_playlist(self, playlist_name, video_id):
+    def add_to_playlist(self, playlist_name: str, video_id: str) -> None:
         """Adds a video to a playlist with a given name.
 
         Args:
             playlist_name: The playlist name.
             video_id: The video_id to be added.
         """
-        video = self._video_library.get_video(video_id)
-
-        # finding the playlist
+        video = self._videos.get(video_id)
+        playlist = self._playlists.get(normalize_name(playlist_name))
 
-        # any(p.name.lower() == playlist_name.lower() for p in self._playlists)
-        # playlist = next((p for p in self._playlists if p.name.lower() == playlist_name.lower()), None)
-
-        if playlist_name.lower() not in self._playlists:
+        if playlist is None:
             print(f"Cannot add video to {playlist_name}: Playlist does not exist")
             return
         if not video:
@@ -143,167 +148,168 @@ class VideoPlayer:
         if video.flag:
             print(f"Cannot add video to {playlist_name}: Video is currently flagged (reason: {video.flag})")
             return
-        playlist = self._playlists[playlist_name.lower()]
-        if video in playlist.videos:
+        if video in playlist:
             print(f"Cannot add video to {playlist_name}: Video already added")
             return
-        playlist.videos.append(video)
+        playlist.add(video)
         print(f"Added video to {playlist_name}: {video.title}")
 
-    def show_all_playlists(self):
+    def show_all_playlists(self) -> None:
         """Display all playlists."""
 
         if len(self._playlists) == 0:
             print("No playlists exist yet")
         else:
             print("Showing all playlists:")
-            for playlist in sorted(self._playlists):
-                print(f"  {self._playlists[playlist].name}")
+            print("\n".join(f"  {p.name}" for p in sorted(self._playlists.values(), key=lambda p: p.key)))
         return
 
-    def show_playlist(self, playlist_name):
+    def show_playlist(self, playlist_name: str) -> None:
         """Display all videos in a playlist with a given name.
 
         Args:
             playlist_name: The playlist name.
         """
-        if playlist_name.lower() not in self._playlists:
+        playlist = self._playlists.get(normalize_name(playlist_name))
+        if playlist is None:
             print(f"Cannot show playlist {playlist_name}: Playlist does not exist")
             return
-        playlist = self._playlists[playlist_name.lower()]
         print(f"Showing playlist: {playlist_name}")
         if not playlist.videos:
             print(f"No videos here yet")
             return
-        for v in playlist.videos:
-            print(v)
+        print("\n".join(map(str, playlist.videos.values())))
 
-    def remove_from_playlist(self, playlist_name, video_id):
+    def remove_from_playlist(self, playlist_name: str, video_id: str) -> None:
         """Removes a video to a playlist with a given name.
 
         Args:
             playlist_name: The playlist name.
             video_id: The video_id to be removed.
         """
-        video = self._video_library.get_video(video_id)
+        video = self._videos.get(video_id)
+        playlist = self._playlists.get(normalize_name(playlist_name))
 
-        if playlist_name.lower() not in self._playlists:
+        if playlist is None:
             print(f"Cannot remove video from {playlist_name}: Playlist does not exist")
             return
         if not video:
             print(f"Cannot remove video from {playlist_name}: Video does not exist")
             return
-        playlist = self._playlists[playlist_name.lower()]
-        if video not in playlist.videos:
+        if video not in playlist:
             print(f"Cannot remove video from {playlist_name}: Video is not in playlist")
             return
-        playlist.videos.remove(video)
+        playlist.remove(video)
         print(f"Removed video from {playlist_name}: {video.title}")
 
-    def clear_playlist(self, playlist_name):
+    def clear_playlist(self, playlist_name: str) -> None:
         """Removes all videos from a playlist with a given name.
 
         Args:
             playlist_name: The playlist name.
         """
-        if playlist_name.lower() not in self._playlists:
+        playlist = self._playlists.get(normalize_name(playlist_name))
+        if playlist is None:
             print(f"Cannot clear playlist {playlist_name}: Playlist does not exist")
             return
-        playlist = self._playlists[playlist_name.lower()]
-        playlist.videos.clear()
+        playlist.clear()
         print(f"Successfully removed all videos from {playlist_name}")
 
-    def delete_playlist(self, playlist_name):
+    def delete_playlist(self, playlist_name: str) -> None:
         """Deletes a playlist with a given name.
 
         Args:
             playlist_name: The playlist name.
         """
-        if playlist_name.lower() not in self._playlists:
+        key = normalize_name(playlist_name)
+        if key not in self._playlists:
             print(f"Cannot delete playlist {playlist_name}: Playlist does not exist")
             return
-        del self._playlists[playlist_name.lower()]
+        del self._playlists[key]
         print(f"Deleted playlist: {playlist_name}")
 
-    def _search_general(self, query, result):
-        ordered = sorted(result, key=lambda v: v.title)
+    def _search_general(self, query: str, result: Iterable[Video]) -> None:
+        # results arrive already ordered by title
+        ordered = list(result)
         if not ordered:
             print(f"No search results for {query}")
             return
-        print(f"Here are the results for {query}:")
-        for i in range(len(ordered)):
-            print(f"{i + 1}) {ordered[i]}")
+        print("\n".join([f"Here are the results for {query}:",
+                         *[f"{i}) {v}" for i, v in enumerate(ordered, 1)]]))
         print("Would you like to play any of the above? If yes, specify the number of the video.\nIf your "
               "answer is not a valid number, we will assume it's a no.")
-        answer = input()
-        if not answer.isnumeric():
+        answer = self._reader()
+        if not answer.isdecimal():
             return
         ans = int(answer)
         if 0 < ans <= len(ordered):
             self.play_video(ordered[ans - 1].video_id)
 
-    def search_videos(self, search_term):
+    def search_videos(self, search_term: str) -> None:
         """Display all the videos whose titles contain the search_term.
 
         Args:
             search_term: The query to be used in search.
         """
-        self._search_general(search_term,
-                             filter(lambda v: search_term.lower() in v.title.lower(),
-                                    self._video_library.get_unflagged_videos()))
+        self._search_general(search_term, self._title_search(search_term.lower()))
 
-    def search_videos_tag(self, video_tag):
+    def search_videos_tag(self, video_tag: str) -> None:
         """Display all videos whose tags contains the provided tag.
 
         Args:
             video_tag: The video tag to be used in search.
         """
-        self._search_general(video_tag,
-                             filter(lambda v: video_tag.lower() in {t.lower() for t in v.tags},
-                                    self._video_library.get_unflagged_videos()))
+        self._search_general(video_tag, self._tag_search(video_tag.lower()))
+
+    def _do_title_search(self, needle: str) -> Tuple[Video, ...]:
+        return tuple(self._video_library.search_titles(needle))
 
-    def flag_video(self, video_id, flag_reason=""):
+    def _do_tag_search(self, needle: str) -> Tuple[Video, ...]:
+        return tuple(v for v in self._video_library.get_unflagged_videos()
+                     if needle in v.tags_lower)
+
+    def _clear_search_cache(self) -> None:
+        self._title_search.cache_clear()
+        self._tag_search.cache_clear()
+
+    def flag_video(self, video_id: str, flag_reason: str = "") -> None:
         """Mark a video as flagged.
 
         Args:
             video_id: The video_id to be flagged.
             flag_reason: Reason for flagging the video.
         """
-        try:
-            video = self._video_library[video_id]
-        except VideoLibraryError as e:
-            print(f"Cannot flag video: {e}")
-            return
-        if not video:
+        video = self._videos.get(video_id)
+        if video is None:
             print("Cannot flag video: Video does not exist")
             return
         if video.flag:
             print("Cannot flag video: Video is already flagged")
             return
         flag_reason = "Not supplied" if not flag_reason else flag_reason
-        if self._playback.state != PlaybackState.STOPPED:
-            if self._playback.get_video() == video:
-                self.stop_video()
+        playing, state = self._playback.snapshot()
+        if state != PlaybackState.STOPPED and playing is video:
+            self.stop_video()
         video.flag = flag_reason
+        self._video_library.flag_video_hook(video)
+        self._clear_search_cache()
         print(f"Successfully flagged video: {video.title} (reason: {flag_reason})")
 
-    def allow_video(self, video_id):
+    def allow_video(self, video_id: str) -> None:
         """Removes a flag from a video.
 
         Args:
             video_id: The video_id to be allowed again.
         """
-        try:
-            video = self._video_library[video_id]
-        except VideoLibraryError as e:
-            print(f"Cannot remove flag from video: {e}")
-            return
-        if not video:
+        video = self._videos.get(video_id)
+        if video is None:
             print("Cannot remove flag from video: Video does not exist")
             return
         if not video.flag:
             print("Cannot remove flag from video: Video is not flagged")
             return
         video.flag = None
+        self._video_library.unflag_video_hook()
+        self._clear_search_cache()
 
         print(f"Successfully removed flag from video: {video.title}")
@@ -1,12 +1,38 @@
 """A video playlist class."""
+from typing import Dict
+
+from .video import Video
 
 
 class PlaylistError(Exception):
     pass
 
 
+def normalize_name(name: str) -> str:
+    """Returns the case-insensitive key a playlist name is stored under."""
+    return name.casefold()
+
+
 class Playlist:
     """A class used to represent a Playlist."""
-    def __init__(self, name):
+    def __init__(self, name: str) -> None:
         self.name = name
-        self.videos = []
+        # case-insensitive key the playlist is stored under
+        self.key = normalize_name(name)
+        # video_id -> Video, in the order the videos were added
+        self.videos: Dict[str, Video] = {}
+
+    def add(self, video: Video) -> None:
+        """Appends a video to the end of the playlist."""
+        self.videos[video.video_id] = video
+
+    def remove(self, video: Video) -> None:
+        """Removes a video from the playlist."""
+        del self.videos[video.video_id]
+
+    def clear(self) -> None:
+        """Removes all videos from the playlist."""
+        self.videos.clear()
+
+    def __contains__(self, video: Video) -> bool:
+        return video.video_id in self.videos
@@ -22,6 +22,27 @@ def test_create_existing_playlist(capfd):
             "exists") in lines[1]
 
 
+def test_create_playlist_strips_unicode_whitespace(capfd):
+    player = VideoPlayer()
+    player.create_playlist("my\u3000PLAY\xa0list")
+    out, err = capfd.readouterr()
+    lines = out.splitlines()
+    assert len(lines) == 1
+    assert "Successfully created new playlist: myPLAYlist" in lines[0]
+
+
+def test_show_playlist_casefolded_name(capfd):
+    player = VideoPlayer()
+    player.create_playlist("Straße")
+    player.show_playlist("STRASSE")
+    out, err = capfd.readouterr()
+    lines = out.splitlines()
+    assert len(lines) == 3
+    assert "Successfully created new playlist: Straße" in lines[0]
+    assert "Showing playlist: STRASSE" in lines[1]
+    assert "No videos here yet" in lines[2]
+
+
 def test_add_to_playlist(capfd):
     player = VideoPlayer()
     player.create_playlist("my_COOL_playlist")
@@ -38,6 +38,16 @@ def test_search_videos_and_play_answer(capfd):
     assert "Playing video: Another Cat Video" in lines[5]
 
 
+def test_search_videos_with_injected_reader(capfd):
+    player = VideoPlayer(reader=lambda: '1')
+    player.search_videos("cat")
+
+    out, err = capfd.readouterr()
+    lines = out.splitlines()
+    assert len(lines) == 6
+    assert "Playing video: Amazing Cats" in lines[5]
+
+
 @mock.patch('builtins.input', lambda *args: '6')
 def test_search_videos_number_out_of_bounds(capfd):
     player = VideoPlayer()
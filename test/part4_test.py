@@ -171,6 +171,80 @@ def test_flag_video_search_videos_with_tag(capfd):
             "it's a no.") in lines[4]
 
 
+@mock.patch('builtins.input', lambda *args: 'No')
+def test_flag_video_after_search_videos(capfd):
+    player = VideoPlayer()
+    player.search_videos("cat")
+    player.flag_video("amazing_cats_video_id", "dont_like_cats")
+    player.search_videos("cat")
+    out, err = capfd.readouterr()
+    lines = out.splitlines()
+    assert len(lines) == 10
+    assert "1) Amazing Cats (amazing_cats_video_id) [#cat #animal]" in lines[1]
+    assert "Successfully flagged video: Amazing Cats " \
+           "(reason: dont_like_cats)" in lines[5]
+    assert "Here are the results for cat:" in lines[6]
+    assert "1) Another Cat Video (another_cat_video_id) [#cat #animal]" in \
+           lines[7]
+    assert "Amazing Cats" not in "\n".join(lines[6:])
+
+
+@mock.patch('builtins.input', lambda *args: 'No')
+def test_allow_video_after_search_videos(capfd):
+    player = VideoPlayer()
+    player.flag_video("amazing_cats_video_id", "dont_like_cats")
+    player.search_videos("cat")
+    player.allow_video("amazing_cats_video_id")
+    player.search_videos("cat")
+    out, err = capfd.readouterr()
+    lines = out.splitlines()
+    assert len(lines) == 11
+    assert "1) Another Cat Video (another_cat_video_id) [#cat #animal]" in \
+           lines[2]
+    assert "Successfully removed flag from video: Amazing Cats" in lines[5]
+    assert "Here are the results for cat:" in lines[6]
+    assert "1) Amazing Cats (amazing_cats_video_id) [#cat #animal]" in lines[7]
+    assert "2) Another Cat Video (another_cat_video_id) [#cat #animal]" in \
+           lines[8]
+
+
+@mock.patch('builtins.input', lambda *args: 'No')
+def test_flag_video_after_search_videos_with_tag(capfd):
+    player = VideoPlayer()
+    player.search_videos_tag("#cat")
+    player.flag_video("amazing_cats_video_id", "dont_like_cats")
+    player.search_videos_tag("#cat")
+    out, err = capfd.readouterr()
+    lines = out.splitlines()
+    assert len(lines) == 10
+    assert "1) Amazing Cats (amazing_cats_video_id) [#cat #animal]" in lines[1]
+    assert "Successfully flagged video: Amazing Cats " \
+           "(reason: dont_like_cats)" in lines[5]
+    assert "Here are the results for #cat:" in lines[6]
+    assert "1) Another Cat Video (another_cat_video_id) [#cat #animal]" in \
+           lines[7]
+    assert "Amazing Cats" not in "\n".join(lines[6:])
+
+
+@mock.patch('builtins.input', lambda *args: 'No')
+def test_allow_video_after_search_videos_with_tag(capfd):
+    player = VideoPlayer()
+    player.flag_video("amazing_cats_video_id", "dont_like_cats")
+    player.search_videos_tag("#cat")
+    player.allow_video("amazing_cats_video_id")
+    player.search_videos_tag("#cat")
+    out, err = capfd.readouterr()
+    lines = out.splitlines()
+    assert len(lines) == 11
+    assert "1) Another Cat Video (another_cat_video_id) [#cat #animal]" in \
+           lines[2]
+    assert "Successfully removed flag from video: Amazing Cats" in lines[5]
+    assert "Here are the results for #cat:" in lines[6]
+    assert "1) Amazing Cats (amazing_cats_video_id) [#cat #animal]" in lines[7]
+    assert "2) Another Cat Video (another_cat_video_id) [#cat #animal]" in \
+           lines[8]
+
+
 def test_flag_video_stops_playing_video(capfd):
     player = VideoPlayer()
     player.play_video("amazing_cats_video_id")
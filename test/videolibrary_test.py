@@ -24,3 +24,87 @@ def test_parses_video_correctly_without_tags():
     assert video.title == "Video about nothing"
     assert video.video_id == "nothing_video_id"
     assert video.tags == ()
+
+
+def test_all_videos_ordered_by_string(tmp_path):
+    videos_file = tmp_path / "videos.txt"
+    videos_file.write_text("Cat | cat_id | #cat\n"
+                           "Cat & Dog | cat_dog_id | #cat, #dog\n"
+                           "Bird | bird_id |\n")
+    library = VideoLibrary(videos_file)
+
+    assert [v.video_id for v in library.get_all_videos()] == \
+           ["bird_id", "cat_dog_id", "cat_id"]
+
+
+def _search_library(tmp_path):
+    videos_file = tmp_path / "videos.txt"
+    videos_file.write_text("Cat & Dog | cat_dog_id | #cat, #dog\n"
+                           "Zebra cat | zebra_id |\n"
+                           "Alpha cat | alpha_id |\n"
+                           "dog dog dog | dog_id | #dog\n"
+                           "Cat | cat_id | #cat\n")
+    return VideoLibrary(videos_file)
+
+
+def _search_ids(library, needle):
+    return [v.video_id for v in library.search_titles(needle)]
+
+
+def test_search_titles_first_and_last_title(tmp_path):
+    library = _search_library(tmp_path)
+
+    assert _search_ids(library, "alpha") == ["alpha_id"]
+    assert _search_ids(library, "zebra") == ["zebra_id"]
+
+
+def test_search_titles_whole_title(tmp_path):
+    library = _search_library(tmp_path)
+
+    assert _search_ids(library, "dog dog dog") == ["dog_id"]
+    assert _search_ids(library, "cat") == \
+           ["alpha_id", "cat_id", "cat_dog_id", "zebra_id"]
+
+
+def test_search_titles_several_matches_in_one_title(tmp_path):
+    library = _search_library(tmp_path)
+
+    assert _search_ids(library, "dog") == ["cat_dog_id", "dog_id"]
+
+
+def test_search_titles_empty_needle(tmp_path):
+    library = _search_library(tmp_path)
+
+    assert _search_ids(library, "") == \
+           ["alpha_id", "cat_id", "cat_dog_id", "zebra_id", "dog_id"]
+
+
+def test_search_titles_needle_spanning_titles(tmp_path):
+    library = _search_library(tmp_path)
+
+    assert _search_ids(library, "cat\ncat") == []
+
+
+def test_search_titles_skips_flagged_videos(tmp_path):
+    library = _search_library(tmp_path)
+    library.get_video("cat_id").flag = "dont_like_cats"
+
+    assert _search_ids(library, "cat") == ["alpha_id", "cat_dog_id", "zebra_id"]
+
+
+def test_flag_hooks_keep_unflagged_videos_in_order():
+    library = VideoLibrary()
+    video = library.get_video("another_cat_video_id")
+
+    video.flag = "dont_like_cats"
+    library.flag_video_hook(video)
+    assert [v.video_id for v in library.get_unflagged_videos()] == \
+           ["amazing_cats_video_id", "funny_dogs_video_id",
+            "life_at_google_video_id", "nothing_video_id"]
+
+    video.flag = None
+    library.unflag_video_hook()
+    assert [v.video_id for v in library.get_unflagged_videos()] == \
+           ["amazing_cats_video_id", "another_cat_video_id",
+            "funny_dogs_video_id", "life_at_google_video_id",
+            "nothing_video_id"]
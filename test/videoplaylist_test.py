@@ -0,0 +1,28 @@
+from src.video import Video
+from src.video_playlist import Playlist
+
+
+def test_playlist_keeps_insertion_order():
+    playlist = Playlist("my_playlist")
+    first = Video("First", "first_id", [])
+    second = Video("Second", "second_id", [])
+    third = Video("Third", "third_id", [])
+
+    playlist.add(first)
+    playlist.add(second)
+    playlist.add(third)
+    playlist.remove(first)
+    playlist.add(first)
+
+    assert list(playlist.videos.values()) == [second, third, first]
+
+
+def test_playlist_membership_by_video_id():
+    playlist = Playlist("my_playlist")
+    playlist.add(Video("Amazing Cats", "amazing_cats_video_id", ["#cat"]))
+
+    assert Video("Other Title", "amazing_cats_video_id", []) in playlist
+    assert Video("Amazing Cats", "another_cat_video_id", ["#cat"]) not in playlist
+
+    playlist.clear()
+    assert Video("Amazing Cats", "amazing_cats_video_id", ["#cat"]) not in playlist